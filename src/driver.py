@@ -6,35 +6,46 @@ from pprint import pprint
 from dotenv import load_dotenv
 import logging
 import aiohttp
-from main import CoinBot
+from main import BotConfig, CoinBot, FleetAgent
 
 load_dotenv()
 
 logging.basicConfig(level=logging.DEBUG)
 server = getenv("SERVER")
+config_path = getenv("BOT_CONFIG")
 
 
 async def main():
-    coinbot = CoinBot()
+    coinbot = CoinBot(config=BotConfig.load(config_path))
     await coinbot.setup()
 
-    photo1 = await coinbot.cameras.camera1.capture()
-    photo2 = await coinbot.cameras.camera2.capture()
-    image1b64 = f"data:image/jpg;base64,{base64.b64encode(photo1).decode('ascii')}"
-    image2b64 = f"data:image/jpg;base64,{base64.b64encode(photo2).decode('ascii')}"
-
-    async with aiohttp.ClientSession() as session:
-        for imageb64 in (image1b64, image2b64):
-            logging.debug("Uploading image")
-            logging.debug(imageb64)
-            async with session.post(
-                f"{server}/coin/images/",
-                data={
-                    "image": imageb64,
-                },
-            ) as response:
-                pprint(response.status)
-                pprint(await response.json())
+    fleet_agent = None
+    if coinbot.config.fleet.collector is not None:
+        fleet_agent = FleetAgent(coinbot)
+        fleet_agent.start()
+
+    try:
+        photo1 = await coinbot.cameras.camera1.capture()
+        photo2 = await coinbot.cameras.camera2.capture()
+        image1b64 = f"data:image/jpg;base64,{base64.b64encode(photo1).decode('ascii')}"
+        image2b64 = f"data:image/jpg;base64,{base64.b64encode(photo2).decode('ascii')}"
+
+        async with aiohttp.ClientSession() as session:
+            for imageb64 in (image1b64, image2b64):
+                logging.debug("Uploading image")
+                logging.debug(imageb64)
+                async with session.post(
+                    f"{server}/coin/images/",
+                    data={
+                        "image": imageb64,
+                    },
+                ) as response:
+                    pprint(response.status)
+                    pprint(await response.json())
+    finally:
+        # Flush the last telemetry and detach the log counter even if sorting failed
+        if fleet_agent is not None:
+            await fleet_agent.stop()
 
 
 if __name__ == "__main__":
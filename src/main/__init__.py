@@ -1 +1,16 @@
-from main.coinbot import CoinBot
+import importlib
+
+# Exports are imported on first use so that modules which don't drive the hardware,
+# such as main.config and main.hardware.holding, can be imported without the camera
+# and Blinka libraries installed.
+_exports = {
+    "CoinBot": "main.coinbot",
+    "BotConfig": "main.config",
+    "FleetAgent": "main.fleet",
+}
+
+
+def __getattr__(name):
+    if name in _exports:
+        return getattr(importlib.import_module(_exports[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
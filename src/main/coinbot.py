@@ -1,3 +1,4 @@
+from .config import BotConfig
 from .hardware.cameras import Cameras
 from .hardware.motor import Motor
 from .hardware.servos import Servos
@@ -8,14 +9,25 @@ class CoinBot:
     The main interface for the coin sorting bot.
 
     attributes:
+        config: The configuration of this bot, including its hardware map.
         servos: Instance of Servos class containing all servos connected to bot.
         motor: Instance of Motor class containing the motor connected to bot.
     """
 
-    def __init__(self, servos: bool = True, motor: bool = True, cameras: bool = True):
+    def __init__(
+        self,
+        servos: bool = True,
+        motor: bool = True,
+        cameras: bool = True,
+        config: BotConfig = None,
+    ):
         """
         Initialize the CoinBot class.
+
+        Arguments:
+            config: The configuration of this bot. Defaults to the standard hardware map.
         """
+        self.config = config if config is not None else BotConfig()
         self.servos = None
         self.motor = None
         self.cameras = None
@@ -34,21 +46,27 @@ class CoinBot:
         """
         Setup the servos.
         """
+        config = self.config.servos
         self.servos = Servos(
-            active_angle=150,
-            neutral_angle=0,
-            connections=[0, 1, 2, 3, 4, 5, 6, 7, 8],
-            address=0x41,
+            active_angle=config.active_angle,
+            neutral_angle=config.neutral_angle,
+            connections=config.connections,
+            address=config.address,
         )
 
     def _setup_motor(self):
         """
         Setup the motor.
         """
+        config = self.config.motor
         self.motor = Motor(
-            port=1,
-            released=True,
-            address=0x60,
+            port=config.port,
+            released=config.released,
+            address=config.address,
+            auto_unlock=config.auto_unlock,
+            auto_unlock_duration=config.auto_unlock_duration,
+            hold_duty=config.hold_duty,
+            hold_reduce_after=config.hold_reduce_after,
         )
 
     def _setup_cameras(self):
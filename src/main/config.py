@@ -0,0 +1,248 @@
+import json
+import logging
+import socket
+from dataclasses import dataclass, field, fields
+
+from .hardware.holding import motor_timeout_duration
+
+logger = logging.getLogger(__name__)
+
+
+def _address(value: int | str) -> int:
+    """Parse an I2C address given either as an int or a string such as "0x41"."""
+    if isinstance(value, str):
+        return int(value, 0)
+    return value
+
+
+def _is_int(value) -> bool:
+    # bool is a subclass of int, but true/false is never a valid number here
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value) -> bool:
+    return _is_int(value) or isinstance(value, float)
+
+
+def _check(valid: bool, message: str):
+    """Raise InvalidConfig with the given message if a setting is not valid."""
+    if not valid:
+        raise BotConfig.InvalidConfig(message)
+
+
+def _check_address(address):
+    _check(
+        _is_int(address) and 0 <= address <= 0x7F,
+        f"Address {address!r} is invalid. It must be an I2C address from 0 to 0x7f.",
+    )
+
+
+@dataclass
+class ServosConfig:
+    """
+    Hardware map of the servo hat.
+
+    Attributes:
+        address: The address of the servo hat.
+        connections: The pins the servos are connected to.
+        active_angle: The angle the servos should be at when toggled.
+        neutral_angle: The angle the servos should be at rest.
+    """
+
+    address: int = 0x41
+    connections: list[int] = field(default_factory=lambda: list(range(9)))
+    active_angle: int = 150
+    neutral_angle: int = 0
+
+    def __post_init__(self):
+        _check_address(self.address)
+        _check(
+            isinstance(self.connections, list)
+            and all(_is_int(i) and 0 <= i <= 15 for i in self.connections),
+            f"Servo connections {self.connections!r} are invalid. They must be a list "
+            "of ports from 0 to 15.",
+        )
+        for name in ("active_angle", "neutral_angle"):
+            angle = getattr(self, name)
+            _check(
+                _is_number(angle) and 0 <= angle <= 180,
+                f"Servo {name} {angle!r} is invalid. It must be from 0 to 180.",
+            )
+
+
+@dataclass
+class MotorConfig:
+    """
+    Hardware map and holding policy of the motor hat.
+
+    Attributes:
+        address: The address of the motor hat.
+        port: The port the stepper motor is plugged in to.
+        released: Whether to start the motor in released position.
+        auto_unlock: Whether to unlock the motor after it has been idle for too long.
+        auto_unlock_duration: How long the motor may sit locked without stepping.
+        hold_duty: Fraction of full current to hold the motor's position with.
+        hold_reduce_after: How long the motor must be idle before reducing current.
+    """
+
+    address: int = 0x60
+    port: int = 1
+    released: bool = True
+    auto_unlock: bool = True
+    auto_unlock_duration: float = motor_timeout_duration
+    hold_duty: float = 1.0
+    hold_reduce_after: float = 1.0
+
+    def __post_init__(self):
+        _check_address(self.address)
+        _check(
+            _is_int(self.port) and self.port in (0, 1),
+            f"Motor port {self.port!r} is invalid. It must be either 0 or 1.",
+        )
+        for name in ("released", "auto_unlock"):
+            _check(
+                isinstance(getattr(self, name), bool),
+                f"Motor {name} {getattr(self, name)!r} is invalid. It must be true or "
+                "false.",
+            )
+        _check(
+            _is_number(self.auto_unlock_duration) and self.auto_unlock_duration > 0,
+            f"Motor auto_unlock_duration {self.auto_unlock_duration!r} is invalid. It "
+            "must be a number of seconds greater than 0.",
+        )
+        _check(
+            _is_number(self.hold_duty) and 0 < self.hold_duty <= 1,
+            f"Motor hold_duty {self.hold_duty!r} is invalid. It must be greater than 0 "
+            "and at most 1.",
+        )
+        _check(
+            _is_number(self.hold_reduce_after) and self.hold_reduce_after >= 0,
+            f"Motor hold_reduce_after {self.hold_reduce_after!r} is invalid. It must "
+            "be a number of seconds of at least 0.",
+        )
+
+
+@dataclass
+class FleetConfig:
+    """
+    Settings for pushing telemetry to the fleet collector.
+
+    Attributes:
+        collector: URL telemetry batches are posted to. Fleet mode is disabled if this
+            is None.
+        interval: Seconds between telemetry samples and pushes.
+        max_backoff: The longest to wait between pushes while the collector is failing.
+        max_batch: The most samples to keep buffered while the collector is unreachable.
+            The oldest samples are dropped first.
+    """
+
+    collector: str | None = None
+    interval: float = 10
+    max_backoff: float = 60 * 5
+    max_batch: int = 60
+
+    def __post_init__(self):
+        _check(
+            self.collector is None or isinstance(self.collector, str),
+            f"Fleet collector {self.collector!r} is invalid. It must be a URL.",
+        )
+        _check(
+            _is_number(self.interval) and self.interval > 0,
+            f"Fleet interval {self.interval!r} is invalid. It must be a number of "
+            "seconds greater than 0.",
+        )
+        _check(
+            _is_number(self.max_backoff) and self.max_backoff >= self.interval,
+            f"Fleet max_backoff {self.max_backoff!r} is invalid. It must be a number "
+            "of seconds of at least the interval.",
+        )
+        _check(
+            _is_int(self.max_batch) and self.max_batch > 0,
+            f"Fleet max_batch {self.max_batch!r} is invalid. It must be a whole number "
+            "greater than 0.",
+        )
+
+
+@dataclass
+class BotConfig:
+    """
+    Configuration of a single coinbot.
+
+    Attributes:
+        name: Identifier of the bot within the fleet. Defaults to the hostname.
+        servos: Hardware map of the servo hat.
+        motor: Hardware map of the motor hat.
+        fleet: Settings for pushing telemetry to the fleet collector.
+    """
+
+    name: str = field(default_factory=socket.gethostname)
+    servos: ServosConfig = field(default_factory=ServosConfig)
+    motor: MotorConfig = field(default_factory=MotorConfig)
+    fleet: FleetConfig = field(default_factory=FleetConfig)
+
+    def __post_init__(self):
+        _check(
+            isinstance(self.name, str) and self.name,
+            f"Bot name {self.name!r} is invalid. It must be a non-empty string.",
+        )
+
+    class InvalidConfig(Exception):
+        """An exception for a config file that does not match the expected layout."""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BotConfig":
+        """
+        Build a config from a dictionary, filling in defaults for anything missing.
+
+        Arguments:
+            data: The parsed contents of a config file.
+        """
+        sections = {
+            "servos": ServosConfig,
+            "motor": MotorConfig,
+            "fleet": FleetConfig,
+        }
+        kwargs = {}
+        for key, value in data.items():
+            if key == "name":
+                kwargs[key] = value
+            elif key in sections:
+                if not isinstance(value, dict):
+                    raise cls.InvalidConfig(
+                        f"Config section {key} must be an object, not {value!r}"
+                    )
+                section = sections[key]
+                known = {f.name for f in fields(section)}
+                unknown = set(value) - known
+                if unknown:
+                    raise cls.InvalidConfig(
+                        f"Unknown {key} settings {sorted(unknown)}. Valid settings are "
+                        f"{sorted(known)}"
+                    )
+                if "address" in value:
+                    try:
+                        value = {**value, "address": _address(value["address"])}
+                    except ValueError:
+                        raise cls.InvalidConfig(
+                            f"Invalid {key} address {value['address']!r}"
+                        )
+                kwargs[key] = section(**value)
+            else:
+                raise cls.InvalidConfig(f"Unknown config section {key}")
+        return cls(**kwargs)
+
+    @classmethod
+    def load(cls, path: str | None) -> "BotConfig":
+        """
+        Load a config from a JSON file. If no path is given, the defaults are used.
+
+        Arguments:
+            path: Path to the config file.
+        """
+        if path is None:
+            logger.info("No bot config given, using defaults")
+            return cls()
+        with open(path) as file:
+            config = cls.from_dict(json.load(file))
+        logger.info("Loaded config for bot %s from %s", config.name, path)
+        return config
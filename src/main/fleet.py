@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import socket
+from collections import deque
+from time import monotonic, time
+
+import aiohttp
+
+from .config import FleetConfig
+
+logger = logging.getLogger(__name__)
+
+
+def local_ip() -> str | None:
+    """Find the IP address this bot is reachable at on the local network."""
+    try:
+        # Connecting a UDP socket sends nothing; it only picks the outgoing interface
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
+        return None
+
+
+class _LogCounter(logging.Handler):
+    """A logging handler that counts warnings and errors instead of emitting them."""
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.warnings = 0
+        self.errors = 0
+
+    def emit(self, record: logging.LogRecord):
+        if record.levelno >= logging.ERROR:
+            self.errors += 1
+        else:
+            self.warnings += 1
+
+
+class FleetAgent:
+    """
+    Periodically samples a coinbot's telemetry and pushes it to the fleet collector.
+
+    Samples are taken every interval and buffered, then posted together as one batch.
+    While the collector is unreachable the agent keeps sampling but backs off between
+    pushes, dropping the oldest samples once the buffer is full.
+    """
+
+    def __init__(self, coinbot, config: FleetConfig = None, name: str = None):
+        """
+        Initialize the fleet agent.
+
+        Arguments:
+            coinbot: The CoinBot to report on.
+            config: Settings for the collector. Defaults to the bot's fleet config.
+            name: Identifier of the bot. Defaults to the name in the bot's config.
+        """
+        if config is None:
+            config = coinbot.config.fleet
+        if config.collector is None:
+            raise ValueError("Fleet mode requires a collector URL.")
+
+        self.coinbot = coinbot
+        self.config = config
+        self.name = name or coinbot.config.name
+        self.samples = deque(maxlen=config.max_batch)
+        self.failures = 0
+
+        self._task = None
+        self._log_counter = _LogCounter()
+        self._last_sample = None
+
+    def _counters(self) -> dict:
+        """Read the running counters telemetry deltas are computed from."""
+        return {
+            "motor_steps": self.coinbot.motor.steps if self.coinbot.motor else 0,
+            "servo_toggles": self.coinbot.servos.toggles if self.coinbot.servos else 0,
+            "warnings": self._log_counter.warnings,
+            "errors": self._log_counter.errors,
+        }
+
+    def sample(self) -> dict:
+        """
+        Take a telemetry sample covering the time since the previous sample.
+
+        Returns:
+            A dictionary with the sample time, how long it covers, how many motor
+            steps, servo toggles, warnings and errors happened in that time, how many
+            other tasks were alive on the event loop, and the fraction of time the
+            motor coils were energized.
+        """
+        now = monotonic()
+        counters = self._counters()
+        if self._last_sample is None:
+            previous_time, previous = now, counters
+        else:
+            previous_time, previous = self._last_sample
+        self._last_sample = (now, counters)
+
+        sample = {"time": round(time(), 3), "period": round(now - previous_time, 3)}
+        for key, value in counters.items():
+            sample[key] = value - previous[key]
+        # The agent's own task is always alive, so leave it out of the count
+        tasks = asyncio.all_tasks()
+        tasks.discard(self._task)
+        sample["live_tasks"] = len(tasks)
+        if self.coinbot.motor is not None:
+            sample["motor_energized_fraction"] = round(
+                self.coinbot.motor.holding_stats["energized_fraction"], 3
+            )
+        return sample
+
+    async def push(self, session: aiohttp.ClientSession) -> bool:
+        """
+        Post every buffered sample to the collector as one batch.
+
+        Arguments:
+            session: The HTTP session to post with.
+
+        Returns:
+            Whether the collector accepted the batch.
+        """
+        if not self.samples:
+            return True
+        batch = list(self.samples)
+        payload = {"bot": self.name, "ip": local_ip(), "samples": batch}
+        try:
+            async with session.post(self.config.collector, json=payload) as response:
+                if response.status >= 300:
+                    logger.debug("Collector rejected telemetry with %s", response.status)
+                    return False
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            logger.debug("Failed to reach collector: %s", error)
+            return False
+
+        self.samples.clear()
+        logger.debug("Pushed %s telemetry samples", len(batch))
+        return True
+
+    def _backoff(self) -> float:
+        """How long to wait before the next push, given the recent failures."""
+        return min(
+            self.config.interval * 2**self.failures, self.config.max_backoff
+        )
+
+    async def run(self):
+        """Sample and push telemetry until cancelled."""
+        next_push = monotonic()
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.config.interval)
+        ) as session:
+            while True:
+                # Keep reporting even if a single sample or push goes wrong
+                try:
+                    await asyncio.sleep(self.config.interval)
+                    self.samples.append(self.sample())
+                    if monotonic() < next_push:
+                        continue
+                    pushed = await self.push(session)
+                except Exception:
+                    logger.exception("Failed to send telemetry")
+                    pushed = False
+
+                if pushed:
+                    self.failures = 0
+                else:
+                    self.failures += 1
+                    logger.info(
+                        "Collector unavailable, retrying in %ss", self._backoff()
+                    )
+                next_push = monotonic() + self._backoff()
+
+    def start(self):
+        """Start pushing telemetry in the background."""
+        logging.getLogger().addHandler(self._log_counter)
+        # Take a baseline so the first pushed sample covers a full interval
+        self._last_sample = None
+        self.sample()
+        self._task = asyncio.create_task(self.run())
+        logger.info(
+            "Started fleet agent for %s reporting to %s",
+            self.name,
+            self.config.collector,
+        )
+
+    async def stop(self, flush: bool = True):
+        """
+        Stop pushing telemetry.
+
+        Arguments:
+            flush: Whether to take a final sample and push everything buffered before
+                stopping.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            except Exception:
+                logger.exception("Fleet agent stopped unexpectedly")
+            self._task = None
+        try:
+            if flush:
+                self.samples.append(self.sample())
+                async with aiohttp.ClientSession(
+                    timeout=aiohttp.ClientTimeout(total=self.config.interval)
+                ) as session:
+                    await self.push(session)
+        finally:
+            logging.getLogger().removeHandler(self._log_counter)
+        logger.info("Stopped fleet agent")
@@ -0,0 +1,249 @@
+import asyncio
+import logging
+from time import monotonic
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+motor_timeout_duration = 60 * 5
+
+
+class HoldingTorque:
+    """
+    Tracks how long a stepper motor has been energized and decides when to reduce or
+    drop its holding current.
+
+    A single watchdog task sleeps until the next deadline instead of a new task being
+    scheduled for every step. Marking activity only moves a timestamp forward, so it is
+    cheap enough to do on every step of the motor.
+    """
+
+    def __init__(
+        self,
+        release: Callable[[], Awaitable[None]],
+        reduce: Callable[[float], None] = None,
+        idle_release_after: float = None,
+        hold_duty: float = 1.0,
+        reduce_after: float = 1.0,
+        unlock: bool = True,
+    ):
+        """
+        Initialize the holding torque manager.
+
+        Arguments:
+            release: Coroutine function that releases the motor coils.
+            reduce: Function that scales the current coil duty cycles by the given
+                fraction. Only needed if hold_duty is below 1.
+            idle_release_after: How long the motor may hold its position without being
+                stepped before it is released (or a warning is logged if unlock is
+                False). None disables the idle check.
+            hold_duty: Fraction of full current to hold with once the motor has been
+                idle for reduce_after seconds. 1 disables reduced-current holding.
+            reduce_after: How long the motor must be idle before dropping to hold_duty.
+            unlock: Whether to release the motor once it has been idle for
+                idle_release_after seconds (True) or just warn (False).
+        """
+        self._watchdog = None
+        self._wakeup = asyncio.Event()
+        # The deadline the watchdog is currently sleeping until, if it is sleeping
+        self._sleeping_until = None
+        self._created_at = monotonic()
+        self._energized_since = None
+        self._last_activity = None
+        self._reduced = False
+        self._warned = False
+
+        self._release = release
+        self._reduce = reduce
+        self._idle_release_after = idle_release_after
+        self._reduce_after = reduce_after
+        self._unlock = unlock
+        self.hold_duty = hold_duty
+
+        # Running totals exposed through stats
+        self._energized_total = 0.0
+        self._holds = 0
+        self._reduced_holds = 0
+        self._idle_releases = 0
+        self._longest_hold = 0.0
+
+    @property
+    def energized(self) -> bool:
+        return self._energized_since is not None
+
+    @property
+    def idle_release_after(self) -> float | None:
+        return self._idle_release_after
+
+    @idle_release_after.setter
+    def idle_release_after(self, value: float | None):
+        self._idle_release_after = value
+        self._reschedule()
+
+    @property
+    def reduce_after(self) -> float:
+        return self._reduce_after
+
+    @reduce_after.setter
+    def reduce_after(self, value: float):
+        self._reduce_after = value
+        self._reschedule()
+
+    @property
+    def unlock(self) -> bool:
+        return self._unlock
+
+    @unlock.setter
+    def unlock(self, value: bool):
+        # A hold that was only warned about becomes due for release straight away
+        if value and not self._unlock:
+            self._warned = False
+        self._unlock = value
+        self._reschedule()
+
+    @property
+    def hold_duty(self) -> float:
+        return self._hold_duty
+
+    @hold_duty.setter
+    def hold_duty(self, value: float):
+        if not 0 < value <= 1:
+            raise ValueError(
+                f"Hold duty {value} is invalid. It must be greater than 0 and at most 1."
+            )
+        if value < 1 and self._reduce is None:
+            raise ValueError("A reduce function is required when hold_duty is below 1.")
+        self._hold_duty = value
+        self._reschedule()
+
+    def touch(self, arm: bool = True, stepped: bool = True):
+        """
+        Record that the motor has just been energized or stepped.
+
+        Arguments:
+            arm: Whether the idle and reduced-current deadlines should apply to this
+                hold. If False the motor is left at its present current until it is
+                touched again with arm set to True or released.
+            stepped: Whether the coils were just rewritten at full current by stepping
+                the motor. If False a reduced hold stays reduced and is not reduced
+                again.
+        """
+        now = monotonic()
+        if self._energized_since is None:
+            self._energized_since = now
+            self._holds += 1
+        # Stepping rewrites the coil duty cycles, so the motor is back at full current
+        if stepped:
+            self._reduced = False
+        self._warned = False
+
+        if not arm:
+            self._last_activity = None
+            return
+
+        self._last_activity = now
+        if self._watchdog is None or self._watchdog.done():
+            self._watchdog = asyncio.create_task(self._watch())
+        else:
+            self._reschedule()
+
+    def released(self):
+        """Record that the motor coils have been released."""
+        if self._energized_since is None:
+            return
+        held_for = monotonic() - self._energized_since
+        self._energized_total += held_for
+        self._longest_hold = max(self._longest_hold, held_for)
+        self._energized_since = None
+        self._last_activity = None
+        self._reduced = False
+
+    def _reschedule(self):
+        """
+        Wake the watchdog if the next deadline is now earlier than the one it is
+        sleeping until. Later deadlines are picked up when the watchdog wakes anyway, so
+        a step that only pushes the deadlines back does not wake it.
+        """
+        deadline = self._next_deadline()
+        if deadline is None or self._sleeping_until is None:
+            return
+        if deadline < self._sleeping_until:
+            self._wakeup.set()
+
+    def _next_deadline(self) -> float | None:
+        """Find the time of the next action the watchdog should take, if any."""
+        if self._last_activity is None:
+            return None
+        deadlines = []
+        if self.hold_duty < 1 and not self._reduced:
+            deadlines.append(self._last_activity + self.reduce_after)
+        if self.idle_release_after is not None and not self._warned:
+            deadlines.append(self._last_activity + self.idle_release_after)
+        return min(deadlines, default=None)
+
+    async def _watch(self):
+        """Sleep until the next deadline and apply whatever is due at that time."""
+        while True:
+            self._wakeup.clear()
+            deadline = self._next_deadline()
+            delay = None if deadline is None else deadline - monotonic()
+            if delay is None or delay > 0:
+                # Sleep until the deadline, or until the motor is touched again if there
+                # is none. Either way the deadlines are recomputed after waking.
+                self._sleeping_until = float("inf") if deadline is None else deadline
+                try:
+                    async with asyncio.timeout(delay):
+                        await self._wakeup.wait()
+                except TimeoutError:
+                    pass
+                finally:
+                    self._sleeping_until = None
+                continue
+
+            idle_for = monotonic() - self._last_activity
+            if (
+                self.idle_release_after is not None
+                and idle_for >= self.idle_release_after
+            ):
+                logger.warning(
+                    "Motor has been in locked position for %s seconds", idle_for
+                )
+                if self._unlock:
+                    self._idle_releases += 1
+                    await self._release()
+                else:
+                    self._warned = True
+            elif self.hold_duty < 1 and not self._reduced:
+                self._reduce(self.hold_duty)
+                self._reduced = True
+                self._reduced_holds += 1
+                logger.debug("Reduced motor holding current to %s", self.hold_duty)
+
+    def stats(self) -> dict:
+        """
+        Get statistics about how the motor has been held.
+
+        Returns:
+            A dictionary with the total seconds energized, the current and longest
+            continuous hold in seconds, the fraction of time the coils have been
+            energized since creation (not to be confused with hold_duty),
+            and counts of holds, reduced-current holds and idle releases.
+        """
+        now = monotonic()
+        current_hold = 0.0
+        if self._energized_since is not None:
+            current_hold = now - self._energized_since
+        energized_total = self._energized_total + current_hold
+        uptime = now - self._created_at
+        return {
+            "energized": self.energized,
+            "reduced": self._reduced,
+            "energized_seconds": energized_total,
+            "current_hold_seconds": current_hold,
+            "longest_hold_seconds": max(self._longest_hold, current_hold),
+            "energized_fraction": energized_total / uptime if uptime > 0 else 0.0,
+            "holds": self._holds,
+            "reduced_holds": self._reduced_holds,
+            "idle_releases": self._idle_releases,
+        }
@@ -7,10 +7,9 @@ from typing import Literal
 from adafruit_motor import stepper
 from adafruit_motorkit import MotorKit
 
-logger = logging.getLogger(__name__)
-
+from .holding import HoldingTorque, motor_timeout_duration
 
-motor_timeout_duration = 60 * 5
+logger = logging.getLogger(__name__)
 
 
 class Motor:
@@ -24,7 +23,9 @@ class Motor:
         port: int | str,
         released: bool,
         auto_unlock: bool = True,
-        auto_unlock_duration: float = motor_timeout_duration
+        auto_unlock_duration: float = motor_timeout_duration,
+        hold_duty: float = 1.0,
+        hold_reduce_after: float = 1.0,
     ):
         """
         Initialize the motor.
@@ -36,14 +37,27 @@ class Motor:
             released: Whether to start the motor in released position.
             auto_unlock: Whether to automatically unlock the motor after a certain amount
                 of time. Defaults to True.
-            auto_unlock_duration: How long to wait before automatically unlocking the
-                motor. Defaults to motor_timeout_duration, which is 5 minutes by default.
+            auto_unlock_duration: How long the motor may sit locked without being stepped
+                before automatically unlocking it. Defaults to motor_timeout_duration,
+                which is 5 minutes by default.
+            hold_duty: Fraction of full current to hold the motor's position with once it
+                has stopped stepping, to keep the driver from overheating. Defaults to 1,
+                which holds at full current.
+            hold_reduce_after: How long the motor must go without stepping before its
+                holding current is reduced to hold_duty. Defaults to 1 second.
         """
-        self._ongoing_active_timeout = None
         self._locked = None
         self._spinning_task = None
-        self._auto_unlock = auto_unlock
-        self._auto_unlock_duration = auto_unlock_duration
+        # Running count of steps taken, sampled for fleet telemetry
+        self.steps = 0
+        self.holding = HoldingTorque(
+            release=self.release_motor,
+            reduce=self._reduce_holding_current,
+            idle_release_after=auto_unlock_duration,
+            hold_duty=hold_duty,
+            reduce_after=hold_reduce_after,
+            unlock=auto_unlock,
+        )
         self.kit = MotorKit(address=address)
         self.address = address
         self.port = port
@@ -68,54 +82,55 @@ class Motor:
     def locked(self):
         return self._locked
 
+    @property
+    def holding_stats(self) -> dict:
+        """Statistics about how long and how hard the motor has been held."""
+        return self.holding.stats()
+
     async def set_active_timeout(
         self, duration: float = None, unlock: bool = None
     ):
         """
-        Set a timeout to check and automatically unlock the motor if it is locked for
-        too long to prevent overheating.
+        Change how long the motor may stay locked without stepping before it is
+        automatically unlocked to prevent overheating, and restart the idle countdown.
 
         Arguments:
-            duration: How long to wait before checking locked status.
+            duration: How long the motor may sit idle while locked.
             unlock: Whether to unlock at the end of the interval (True) or just warn
-                (False). Defaults to setting set at initialization of Servos.
+                (False). Defaults to setting set at initialization of Motor.
         """
-        # Use defaults set at initialization if no value is given
-        if duration is None:
-            duration = self._auto_unlock_duration
-        if unlock is None:
-            unlock = self._auto_unlock
-
-        async def _active_timeout():
-            await asyncio.sleep(duration)
-            # Warn the user if the motor is currently locked after the timeout
-            if self._locked:
-                logger.warning(
-                    "Motor has been in locked position for %s seconds",
-                    duration
-                )
-            # Unlock the motor if it is locked and the user has set auto_unlock to True
-            if unlock:
-                await self.release_motor()
-
-        if self._ongoing_active_timeout is not None:
-            self._ongoing_active_timeout.cancel()
-        self._ongoing_active_timeout = asyncio.create_task(_active_timeout())
+        if duration is not None:
+            self.holding.idle_release_after = duration
+        if unlock is not None:
+            self.holding.unlock = unlock
+        if self._locked:
+            self.holding.touch(stepped=False)
+
+    def _reduce_holding_current(self, duty: float):
+        """
+        Scale the duty cycle of every energized coil to hold the current position with
+        less current.
+        """
+        # adafruit_motor has no public hook for holding current, so scale the coil PWM
+        # outputs directly. The next step rewrites them at full current.
+        for coil in self.motor._coil:
+            coil.duty_cycle = int(coil.duty_cycle * duty)
 
     async def lock_motor(self, step_motor: bool = True, set_timeout: bool = True):
         """Lock the motor so that it stays in place."""
         if step_motor:
             self.motor.onestep(direction=stepper.FORWARD, style=stepper.MICROSTEP)
             self.motor.onestep(direction=stepper.BACKWARD, style=stepper.MICROSTEP)
-        self._locked = True
-        if set_timeout:
-            await self.set_active_timeout()
-        logger.info("Locked motor position")
+        self.holding.touch(arm=set_timeout, stepped=step_motor)
+        if not self._locked:
+            self._locked = True
+            logger.info("Locked motor position")
 
     async def release_motor(self):
         """Release the motor to let it freely spin without consuming power."""
         self.motor.release()
         self._locked = False
+        self.holding.released()
         logger.info("Released motor")
 
     async def step_motor(
@@ -145,6 +160,7 @@ class Motor:
             direction = stepper.BACKWARD
 
         self.motor.onestep(direction=direction, style=style)
+        self.steps += 1
 
         if then_release:
             await self.release_motor()
@@ -201,4 +217,4 @@ class Motor:
             self._spinning_task = None
             logger.info("Stopping motor from spinning")
         if release:
-            self.motor.release()
+            await self.release_motor()
@@ -70,6 +70,8 @@ class Servos:
         self.kit = ServoKit(channels=16, address=address)
         self.active_angle = active_angle
         self.neutral_angle = neutral_angle
+        # Running count of servo moves, sampled for fleet telemetry
+        self.toggles = 0
 
         # Map ports servos are connected to to servo instances, and if there are any
         # invalid mappings throw an exception.
@@ -116,6 +118,7 @@ class Servos:
 
         logger.info("Set servo %s to angle %sdeg", servo, angle)
         self.servos[servo].set(angle)
+        self.toggles += 1
 
     async def toggle_servos(self, servos: list[int] = None, angle: int = None):
         """
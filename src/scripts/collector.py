@@ -0,0 +1,24 @@
+import argparse
+import json
+
+from aiohttp import web
+
+
+async def receive(request):
+    batch = await request.json()
+    print(f"{batch['bot']} ({batch['ip']}) sent {len(batch['samples'])} samples")
+    for sample in batch["samples"]:
+        print(json.dumps(sample))
+    return web.Response(status=204)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Stand-in fleet collector that prints the telemetry bots push to it"
+    )
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on")
+    args = parser.parse_args()
+
+    app = web.Application()
+    app.router.add_post("/", receive)
+    web.run_app(app, port=args.port)
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from main.config import BotConfig, FleetConfig, MotorConfig, ServosConfig
+
+
+def test_defaults():
+    config = BotConfig.from_dict({})
+    assert config.servos == ServosConfig()
+    assert config.servos.connections == [0, 1, 2, 3, 4, 5, 6, 7, 8]
+    assert config.servos.address == 0x41
+    assert config.motor == MotorConfig()
+    assert config.motor.address == 0x60
+    assert config.fleet.collector is None
+
+
+def test_partial_section_keeps_defaults():
+    config = BotConfig.from_dict({"name": "bot-2", "motor": {"port": 0}})
+    assert config.name == "bot-2"
+    assert config.motor.port == 0
+    assert config.motor.address == 0x60
+
+
+def test_hex_string_addresses():
+    config = BotConfig.from_dict(
+        {"servos": {"address": "0x42"}, "motor": {"address": 97}}
+    )
+    assert config.servos.address == 0x42
+    assert config.motor.address == 97
+
+
+def test_invalid_address():
+    with pytest.raises(BotConfig.InvalidConfig):
+        BotConfig.from_dict({"motor": {"address": "sixty"}})
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"cameras": {}},
+        {"motor": {"speed": 100}},
+        {"fleet": {"collector": "http://localhost/", "url": "http://localhost/"}},
+    ],
+)
+def test_unknown_keys(data):
+    with pytest.raises(BotConfig.InvalidConfig):
+        BotConfig.from_dict(data)
+
+
+@pytest.mark.parametrize("section", [None, [], "0x60"])
+def test_section_not_an_object(section):
+    with pytest.raises(BotConfig.InvalidConfig):
+        BotConfig.from_dict({"motor": section})
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"name": ""},
+        {"servos": {"address": 300}},
+        {"servos": {"connections": "012"}},
+        {"servos": {"connections": [0, 1, "2"]}},
+        {"servos": {"connections": [16]}},
+        {"servos": {"active_angle": 200}},
+        {"motor": {"port": 2}},
+        {"motor": {"port": "1"}},
+        {"motor": {"released": "yes"}},
+        {"motor": {"hold_duty": 0}},
+        {"motor": {"auto_unlock_duration": -1}},
+        {"fleet": {"interval": "10"}},
+        {"fleet": {"interval": 0}},
+        {"fleet": {"max_batch": 0}},
+        {"fleet": {"max_batch": 1.5}},
+        {"fleet": {"interval": 10, "max_backoff": 5}},
+        {"fleet": {"collector": 8080}},
+    ],
+)
+def test_invalid_values(data):
+    with pytest.raises(BotConfig.InvalidConfig):
+        BotConfig.from_dict(data)
+
+
+def test_load(tmp_path):
+    path = tmp_path / "bot.json"
+    path.write_text(json.dumps({"fleet": {"collector": "http://localhost/"}}))
+    config = BotConfig.load(str(path))
+    assert config.fleet == FleetConfig(collector="http://localhost/")
+    assert BotConfig.load(None) == BotConfig(name=config.name)
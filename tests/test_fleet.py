@@ -0,0 +1,191 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import aiohttp
+from aiohttp import web
+
+from main.config import BotConfig, FleetConfig
+from main.fleet import FleetAgent
+
+
+class Collector:
+    """A stand-in fleet collector that records every batch posted to it."""
+
+    def __init__(self, fail_first: int = 0):
+        self.batches = []
+        self.requests = 0
+        self.fail_first = fail_first
+        self.url = None
+
+    async def receive(self, request):
+        self.requests += 1
+        if self.requests <= self.fail_first:
+            return web.Response(status=500)
+        self.batches.append(await request.json())
+        return web.Response(status=204)
+
+    @property
+    def samples(self) -> list[dict]:
+        return [sample for batch in self.batches for sample in batch["samples"]]
+
+
+@asynccontextmanager
+async def serve(collector: Collector):
+    app = web.Application()
+    app.router.add_post("/", collector.receive)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    collector.url = f"http://{host}:{port}/"
+    try:
+        yield collector
+    finally:
+        await runner.cleanup()
+
+
+def make_bot() -> SimpleNamespace:
+    return SimpleNamespace(
+        config=BotConfig(name="bot-1"),
+        motor=SimpleNamespace(steps=0, holding_stats={"energized_fraction": 0.25}),
+        servos=SimpleNamespace(toggles=0),
+    )
+
+
+def make_agent(bot, url: str, **kwargs) -> FleetAgent:
+    return FleetAgent(bot, config=FleetConfig(collector=url, **kwargs))
+
+
+def test_batches_samples():
+    async def _test():
+        async with serve(Collector()) as collector:
+            bot = make_bot()
+            agent = make_agent(bot, collector.url, interval=0.02)
+            agent.start()
+            for _ in range(5):
+                bot.motor.steps += 2
+                await asyncio.sleep(0.02)
+            await agent.stop()
+
+        assert collector.batches
+        assert all(batch["bot"] == "bot-1" for batch in collector.batches)
+        assert "ip" in collector.batches[0]
+        assert sum(sample["motor_steps"] for sample in collector.samples) == 10
+        assert collector.samples[0]["motor_energized_fraction"] == 0.25
+
+    asyncio.run(_test())
+
+
+def test_counters_are_deltas():
+    async def _test():
+        bot = make_bot()
+        agent = make_agent(bot, "http://localhost/")
+        agent.start()
+        try:
+            bot.motor.steps += 5
+            bot.servos.toggles += 1
+            logging.getLogger("test").error("jammed")
+            first = agent.sample()
+            bot.motor.steps += 3
+            second = agent.sample()
+        finally:
+            await agent.stop(flush=False)
+
+        assert first["motor_steps"] == 5
+        assert first["servo_toggles"] == 1
+        assert first["errors"] == 1
+        assert second["motor_steps"] == 3
+        assert second["servo_toggles"] == 0
+        assert second["errors"] == 0
+        # Only the test itself is alive; the agent's own task is not counted
+        assert second["live_tasks"] == 1
+
+    asyncio.run(_test())
+
+
+def test_backoff_growth():
+    agent = make_agent(make_bot(), "http://localhost/", interval=1, max_backoff=5)
+    delays = []
+    for failures in range(5):
+        agent.failures = failures
+        delays.append(agent._backoff())
+    assert delays == [1, 2, 4, 5, 5]
+
+
+def test_backoff_resets_after_success():
+    async def _test():
+        async with serve(Collector(fail_first=2)) as collector:
+            bot = make_bot()
+            agent = make_agent(bot, collector.url, interval=0.01, max_backoff=0.04)
+            agent.start()
+            failures = []
+            for _ in range(20):
+                await asyncio.sleep(0.01)
+                failures.append(agent.failures)
+            await agent.stop(flush=False)
+
+        assert max(failures) == 2
+        assert agent.failures == 0
+        # Samples taken while backing off were kept and sent together
+        assert len(collector.batches[0]["samples"]) > 1
+
+    asyncio.run(_test())
+
+
+def test_max_batch_drops_oldest():
+    async def _test():
+        async with serve(Collector(fail_first=1)) as collector:
+            bot = make_bot()
+            agent = make_agent(bot, collector.url, max_batch=3)
+            agent.sample()
+            async with aiohttp.ClientSession() as session:
+                for steps in range(1, 6):
+                    bot.motor.steps += steps
+                    agent.samples.append(agent.sample())
+                    if steps == 1:
+                        assert not await agent.push(session)
+                assert [s["motor_steps"] for s in agent.samples] == [3, 4, 5]
+                assert await agent.push(session)
+
+        assert not agent.samples
+        assert [s["motor_steps"] for s in collector.samples] == [3, 4, 5]
+
+    asyncio.run(_test())
+
+
+def test_stop_flushes():
+    async def _test():
+        async with serve(Collector()) as collector:
+            bot = make_bot()
+            agent = make_agent(bot, collector.url, interval=10)
+            agent.start()
+            bot.motor.steps += 7
+            await agent.stop()
+            assert agent._log_counter not in logging.getLogger().handlers
+
+        assert len(collector.batches) == 1
+        assert collector.samples[0]["motor_steps"] == 7
+
+    asyncio.run(_test())
+
+
+def test_keeps_running_after_error():
+    async def _test():
+        async with serve(Collector()) as collector:
+            bot = make_bot()
+            agent = make_agent(bot, collector.url, interval=0.01)
+            agent.start()
+            # Break sampling for a while, then fix it again
+            bot.motor = SimpleNamespace(steps=0, holding_stats={})
+            await asyncio.sleep(0.03)
+            bot.motor = make_bot().motor
+            await asyncio.sleep(0.05)
+            assert not agent._task.done()
+            await agent.stop(flush=False)
+
+        assert collector.batches
+
+    asyncio.run(_test())
@@ -0,0 +1,180 @@
+import asyncio
+import logging
+
+from main.hardware.holding import HoldingTorque
+
+
+class StubMotor:
+    """Records what the holding torque manager asks the motor to do."""
+
+    def __init__(self):
+        self.duty = 1.0
+        self.releases = 0
+        self.holding = None
+
+    async def release(self):
+        self.releases += 1
+        self.holding.released()
+
+    def reduce(self, duty: float):
+        self.duty *= duty
+
+    def step(self):
+        self.duty = 1.0
+        self.holding.touch()
+
+
+def make_holding(**kwargs) -> tuple[HoldingTorque, StubMotor]:
+    motor = StubMotor()
+    motor.holding = HoldingTorque(release=motor.release, reduce=motor.reduce, **kwargs)
+    return motor.holding, motor
+
+
+def test_idle_release():
+    async def _test():
+        holding, motor = make_holding(idle_release_after=0.05)
+        motor.step()
+        await asyncio.sleep(0.02)
+        assert motor.releases == 0
+        await asyncio.sleep(0.06)
+        assert motor.releases == 1
+        assert not holding.energized
+        assert holding.stats()["idle_releases"] == 1
+
+    asyncio.run(_test())
+
+
+def test_warn_only(caplog):
+    async def _test():
+        holding, motor = make_holding(idle_release_after=0.03, unlock=False)
+        motor.step()
+        await asyncio.sleep(0.1)
+        assert motor.releases == 0
+        assert holding.energized
+
+    with caplog.at_level(logging.WARNING):
+        asyncio.run(_test())
+    # Warns once per hold rather than on every wakeup
+    assert len(caplog.records) == 1
+
+
+def test_reduces_once_per_hold():
+    async def _test():
+        holding, motor = make_holding(hold_duty=0.5, reduce_after=0.02)
+        motor.step()
+        await asyncio.sleep(0.05)
+        assert motor.duty == 0.5
+
+        # Touching without stepping leaves the coils reduced, so they must not be
+        # reduced again
+        for _ in range(3):
+            holding.touch(stepped=False)
+            await asyncio.sleep(0.05)
+        assert motor.duty == 0.5
+        assert holding.stats()["reduced_holds"] == 1
+
+        # Stepping restores full current, so the next idle period reduces again
+        motor.step()
+        await asyncio.sleep(0.05)
+        assert motor.duty == 0.5
+        assert holding.stats()["reduced_holds"] == 2
+
+    asyncio.run(_test())
+
+
+def test_reduces_again_while_idle_release_pending():
+    async def _test():
+        holding, motor = make_holding(
+            idle_release_after=2, hold_duty=0.5, reduce_after=0.05
+        )
+        motor.step()
+        await asyncio.sleep(0.1)
+        assert motor.duty == 0.5
+
+        # The watchdog is now sleeping until the idle release, but a new step makes the
+        # reduction due much sooner than that
+        motor.step()
+        await asyncio.sleep(0.1)
+        assert motor.duty == 0.5
+        assert holding.stats()["reduced_holds"] == 2
+        assert motor.releases == 0
+
+    asyncio.run(_test())
+
+
+def test_shortened_timeout_applies_immediately():
+    async def _test():
+        holding, motor = make_holding(idle_release_after=5)
+        motor.step()
+        await asyncio.sleep(0.01)
+        holding.idle_release_after = 0.05
+        holding.touch(stepped=False)
+        await asyncio.sleep(0.1)
+        assert motor.releases == 1
+
+    asyncio.run(_test())
+
+
+def test_enabling_unlock_releases_warned_hold():
+    async def _test():
+        holding, motor = make_holding(idle_release_after=0.02, unlock=False)
+        motor.step()
+        await asyncio.sleep(0.05)
+        assert motor.releases == 0
+        holding.unlock = True
+        await asyncio.sleep(0.01)
+        assert motor.releases == 1
+
+    asyncio.run(_test())
+
+
+def test_touch_rearms():
+    async def _test():
+        holding, motor = make_holding(idle_release_after=0.05)
+        motor.step()
+        await asyncio.sleep(0.08)
+        assert motor.releases == 1
+
+        # The watchdog waits for the next hold instead of exiting
+        motor.step()
+        for _ in range(4):
+            await asyncio.sleep(0.02)
+            motor.step()
+        assert motor.releases == 1
+        await asyncio.sleep(0.08)
+        assert motor.releases == 2
+
+    asyncio.run(_test())
+
+
+def test_single_watchdog_task():
+    async def _test():
+        holding, motor = make_holding(idle_release_after=1, hold_duty=0.5)
+        motor.step()
+        tasks = len(asyncio.all_tasks())
+        for _ in range(1000):
+            motor.step()
+            await asyncio.sleep(0)
+        assert len(asyncio.all_tasks()) == tasks
+
+    asyncio.run(_test())
+
+
+def test_stats():
+    async def _test():
+        holding, motor = make_holding()
+        motor.step()
+        await asyncio.sleep(0.05)
+        await motor.release()
+        await asyncio.sleep(0.02)
+        motor.step()
+        await asyncio.sleep(0.02)
+
+        stats = holding.stats()
+        assert stats["holds"] == 2
+        assert stats["energized"]
+        assert 0.05 <= stats["longest_hold_seconds"] < stats["energized_seconds"]
+        assert stats["current_hold_seconds"] < stats["longest_hold_seconds"]
+        assert 0 < stats["energized_fraction"] < 1
+
+    asyncio.run(_test())